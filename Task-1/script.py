@@ -1,75 +1,139 @@
 # Importing necessary libraries
-import praw
-import json
-from datetime import datetime, timezone
-import re
-import string
+import asyncio
+import asyncpraw
+import ahocorasick
+import orjson
 import nltk
+import os
+import sys
 from nltk.corpus import stopwords
 
 nltk.download('stopwords')
 
+# 256-entry byte table built once: letters are lowercased, every other byte
+# (punctuation, digits, emoji bytes) becomes a space. bytes.translate walks the
+# post once in C, so cleaning needs no regex engine at all.
+_CLEAN_TABLE = bytes(
+    byte + 0x20 if 0x41 <= byte <= 0x5A      # A-Z -> a-z
+    else byte if 0x61 <= byte <= 0x7A        # a-z kept as-is
+    else 0x20                                # everything else -> space
+    for byte in range(256)
+)
+
 def read_app_details_for_authentication(file_name):
     """Reads Reddit authentication details from a file.
     
-    This function opens the specified file, reads its contents line by line, 
-    and returns a list where each element is a line from the file.
-    
+    This function opens the specified file, reads its contents line by line,
+    and groups every three lines (client_id, client_secret, user_agent) into
+    one credential tuple. Listing several apps in the file (three lines each)
+    lets the fetcher spread subreddits across multiple Reddit clients.
+
     Args:
         file_name (str): The name of the file containing authentication details.
-    
+
     Returns:
-        list: A list of strings, each representing a line from the file.
+        list: A list of (client_id, client_secret, user_agent) tuples, one per app.
     """
     with open(file_name, 'r') as f:
-        praw_details = f.read().splitlines()
-    return praw_details
+        lines = [line for line in f.read().splitlines() if line.strip()]
+    credentials = [tuple(lines[i:i + 3]) for i in range(0, len(lines), 3)]
+    return credentials
+
+def build_keyword_automaton(keywords):
+    """Builds an Aho-Corasick automaton for the given keywords.
+
+    The automaton matches every keyword in a single linear scan of a post,
+    instead of one substring search per keyword.
+
+    Args:
+        keywords (list): A list of keywords to match.
+
+    Returns:
+        ahocorasick.Automaton: The compiled automaton (keywords are lowercased).
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword.casefold(), keyword)
+    automaton.make_automaton()
+    return automaton
+
+async def fetch_subreddit_posts(credential, sub, automaton, handle_post, limit=1000):
+    """Fetches relevant posts from a single subreddit.
+
+    This coroutine builds its own Reddit client from the given credential tuple,
+    retrieves hot posts from the subreddit, checks if the post's title or body
+    contains any of the specified keywords, and passes each relevant post to
+    handle_post. While this coroutine awaits the next page from the API, the
+    other subreddits' fetchers keep running on the same event loop.
 
-def fetch_relevant_posts(reddit, subreddits, keywords, limit=1000):
+    Args:
+        credential (tuple): A (client_id, client_secret, user_agent) tuple.
+        sub (str): The name of the subreddit to fetch posts from.
+        automaton (ahocorasick.Automaton): A compiled keyword automaton.
+        handle_post (coroutine function): Called with each relevant post dict.
+        limit (int, optional): The number of posts to fetch. Defaults to 1000.
+
+    Returns:
+        None
+    """
+    reddit = asyncpraw.Reddit(
+        client_id=credential[0],
+        client_secret=credential[1],
+        user_agent=credential[2]
+    )
+
+    try:
+        subreddit = await reddit.subreddit(sub)
+        async for post in subreddit.hot(limit=limit):  # Fetch hot posts
+            full_content = f"{post.title} {post.selftext or ''}".casefold()  # Handle missing selftext
+            if next(automaton.iter(full_content), None) is not None:  # Single-pass keyword match
+                await handle_post({
+                    "subreddit": f"r/{sub}",
+                    "post_id": post.id,
+                    "created_utc": int(post.created_utc),  # Raw epoch; format downstream only when displayed
+                    "content": full_content,
+                    "likes": post.score,
+                    "comments": post.num_comments,
+                    "shares": post.num_crossposts
+                })
+    except Exception as e:
+        print(f"Error fetching posts from r/{sub}: {e}")  # Handle API errors
+    finally:
+        await reddit.close()
+
+async def fetch_relevant_posts(credentials, subreddits, keywords, handle_post, limit=1000):
     """Fetches relevant posts from specified subreddits based on keywords.
-    
-    This function retrieves hot posts from the given list of subreddits, checks if 
-    the post's title or body contains any of the specified keywords, and stores 
-    relevant posts in a structured format.
+
+    This coroutine fetches all subreddits concurrently on one event loop (the
+    workload is network-bound, so overlapping the Reddit API waits cuts wall
+    time roughly by the number of subreddits) and hands every relevant post to
+    handle_post as it arrives. Credentials are assigned round-robin so multiple
+    apps can share the load.
 
     Args:
-        reddit (praw.Reddit): An authenticated Reddit instance.
+        credentials (list): A list of (client_id, client_secret, user_agent) tuples.
         subreddits (list): A list of subreddit names to fetch posts from.
         keywords (list): A list of keywords to filter relevant posts.
-        limit (int, optional): The number of posts to fetch from each subreddit. Defaults to 10.
-
-    Returns:
-        list: A list of dictionaries containing details of relevant posts, including:
+        handle_post (coroutine function): Called with each relevant post dict, including:
               - subreddit (str): The name of the subreddit.
               - post_id (str): The unique ID of the post.
-              - timestamp (str): The post creation time in UTC (YYYY-MM-DD HH:MM:SS).
+              - created_utc (int): The post creation time as a UTC epoch timestamp.
               - content (str): The combined title and body text of the post.
               - likes (int): The number of upvotes (score) the post received.
               - comments (int): The number of comments on the post.
               - shares (int): The number of times the post was crossposted.
+        limit (int, optional): The number of posts to fetch from each subreddit. Defaults to 1000.
+
+    Returns:
+        None
     """
-    filtered_posts = []
-    
-    for sub in subreddits:
-        subreddit = reddit.subreddit(sub)
-
-        try:
-            for post in subreddit.hot(limit=limit):  # Fetch hot posts
-                full_content = f"{post.title} {post.selftext or ''}".casefold()  # Handle missing selftext
-                if any(keyword.casefold() in full_content for keyword in keywords):
-                    filtered_posts.append({
-                        "subreddit": f"r/{sub}",
-                        "post_id": post.id,
-                        "timestamp": datetime.fromtimestamp(post.created_utc, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S'),
-                        "content": full_content,
-                        "likes": post.score,
-                        "comments": post.num_comments,
-                        "shares": post.num_crossposts
-                    })
-        except Exception as e:
-            print(f"Error fetching posts from r/{sub}: {e}")  # Handle API errors
-
-    return filtered_posts
+    # Compile the keywords into one automaton instead of scanning per keyword
+    automaton = build_keyword_automaton(keywords)
+
+    await asyncio.gather(*[
+        fetch_subreddit_posts(credentials[i % len(credentials)], sub, automaton, handle_post, limit)
+        for i, sub in enumerate(subreddits)
+    ])
 
 def save_posts_to_json(posts, filename="filtered_reddit_posts.json", pretty=True):
     """Saves filtered Reddit posts to a JSON file.
@@ -83,8 +147,42 @@ def save_posts_to_json(posts, filename="filtered_reddit_posts.json", pretty=True
     Returns:
         None
     """
-    with open(filename, 'w') as json_file:
-        json.dump(posts, json_file, indent=4 if pretty else None)
+    with open(filename, 'wb') as json_file:
+        json_file.write(orjson.dumps(posts, option=orjson.OPT_INDENT_2 if pretty else 0))
+
+def save_posts_ndjson(posts, filename):
+    """Saves Reddit posts as newline-delimited JSON (one post per line).
+
+    NDJSON lets downstream tasks read the dataset incrementally instead of
+    holding the full array in memory at once.
+
+    Args:
+        posts (list): A list of dictionaries containing Reddit post data.
+        filename (str): The name of the NDJSON file to save.
+
+    Returns:
+        None
+    """
+    with open(filename, 'wb') as ndjson_file:
+        for post in posts:
+            ndjson_file.write(orjson.dumps(post) + b"\n")
+
+def read_fetched_post_ids(filename):
+    """Reads the post ids already present in an NDJSON dataset file.
+
+    Used by --resume to skip posts that an earlier (possibly interrupted)
+    run has already written.
+
+    Args:
+        filename (str): The name of the NDJSON file to scan.
+
+    Returns:
+        set: The post_id values found, or an empty set if the file is missing.
+    """
+    if not os.path.exists(filename):
+        return set()
+    with open(filename, 'rb') as ndjson_file:
+        return {orjson.loads(line)["post_id"] for line in ndjson_file if line.strip()}
 
 def clean_text(text,stopwords):
     """
@@ -98,28 +196,14 @@ def clean_text(text,stopwords):
     Returns:
         str: The cleaned text with stopwords, emojis, and special characters removed.
     """
-    # Remove emojis
-    text = re.sub(r'[^\w\s,]', '', text)  
-
-    # Remove punctuation and special characters
-    text = text.translate(str.maketrans('', '', string.punctuation))
-
-    # Tokenize text and remove stopwords
-    words = text.split()
-    cleaned_words = [word for word in words if word.lower() not in stopwords]
-
-    # Return cleaned text
-    return " ".join(cleaned_words)
-def main():
-    # Read authentication details
-    praw_details = read_app_details_for_authentication('praw_details.txt')
-
-    # Initialize Reddit instance
-    reddit = praw.Reddit(
-        client_id=praw_details[0],
-        client_secret=praw_details[1],
-        user_agent=praw_details[2]
-    )
+    # One byte-level pass over the UTF-8 bytes: non-letters (including every
+    # byte of a multi-byte emoji sequence) become spaces and letters are
+    # lowercased, so only clean ASCII word tokens survive the split
+    cleaned = text.encode("utf-8").translate(_CLEAN_TABLE).decode("ascii")
+    return " ".join(word for word in cleaned.split() if word not in stopwords)
+async def main():
+    # Read authentication details (one credential tuple per app listed in the file)
+    credentials = read_app_details_for_authentication('praw_details.txt')
 
     # Define keywords and subreddits
     keywords = [
@@ -129,24 +213,37 @@ def main():
     ]
     subreddits = ["depression", "mentalhealth", "suicidewatch", "addiction"]
 
-    # Fetch relevant posts
-    filtered_posts = fetch_relevant_posts(reddit, subreddits, keywords)
+    STOPWORDS = frozenset(stopwords.words('english'))
 
-    # Save uncleaned posts to JSON
-    uncleaned_file_name = 'uncleaned_dataset.json'
-    save_posts_to_json(filtered_posts,uncleaned_file_name)
+    uncleaned_file_name = 'uncleaned_dataset.ndjson'
+    cleaned_file_name = 'cleaned_dataset.ndjson'
 
-    print(f"Original Posts details read and saved! ({uncleaned_file_name})")
+    # With --resume, append to the existing files and skip posts an earlier
+    # (possibly interrupted) run already fetched
+    resume = '--resume' in sys.argv[1:]
+    seen_post_ids = read_fetched_post_ids(uncleaned_file_name) if resume else set()
+    mode = 'ab' if resume else 'wb'
 
-    STOPWORDS = set(stopwords.words('english'))
-    for post in filtered_posts:
-        post['content'] = clean_text(text=post['content'],stopwords=STOPWORDS)
-    
-    # Save cleaned posts to JSON
-    cleaned_file_name = 'cleaned_dataset.json'
-    save_posts_to_json(posts=filtered_posts,filename=cleaned_file_name)
+    # Write each post as one NDJSON line as it streams in from the fetchers,
+    # so memory stays flat no matter how many posts come back
+    with open(uncleaned_file_name, mode) as uncleaned_file, open(cleaned_file_name, mode) as cleaned_file:
+        write_lock = asyncio.Lock()
+
+        async def handle_post(post):
+            if post['post_id'] in seen_post_ids:
+                return
+            seen_post_ids.add(post['post_id'])  # Also dedupes crossposts between subreddits
+            uncleaned_line = orjson.dumps(post) + b"\n"
+            post['content'] = clean_text(text=post['content'],stopwords=STOPWORDS)
+            cleaned_line = orjson.dumps(post) + b"\n"
+            async with write_lock:  # The subreddit fetchers share both files
+                uncleaned_file.write(uncleaned_line)
+                cleaned_file.write(cleaned_line)
+
+        await fetch_relevant_posts(credentials, subreddits, keywords, handle_post)
 
+    print(f"Original Posts details read and saved! ({uncleaned_file_name})")
     print(f"Cleaned Posts details read and saved! ({cleaned_file_name})")
-    
+
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,130 +1,128 @@
 # importing libraries
-from textblob import TextBlob
-import json
+from collections import Counter
+import csv
+import orjson
+import re
+import nltk
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
-def analyze_sentiment(text):
-    """
-    Analyzes the sentiment of a given text using TextBlob.
-    
-    Args:
-        text (str): The input text for sentiment analysis.
+nltk.download('vader_lexicon')
 
-    Returns:
-        str: The sentiment classification ('Positive', 'Negative', 'Neutral').
-    """
-    sentiment_score = TextBlob(text).sentiment.polarity
-
-    if sentiment_score > 0:
-        return "Positive"
-    elif sentiment_score < 0:
-        return "Negative"
-    else:
-        return "Neutral"
-    
-def categorize_risk_level(text,high_risk_terms):
-    """
-    Categorizes a post into risk levels based on its content.
-    
-    Args:
-        text (str): The input text of the post.
+# High-Risk: Contains direct crisis phrases
+# This can be extended to be more phrases
+HIGH_RISK_PHRASES = frozenset(["dont want to be here", "cant do this anymore","dont want to live",
+                      "no reason to live", "ending it all", "want to die","want to kill"])
 
-    Returns:
-        str: Risk level ('High-Risk', 'Moderate Concern', 'Low Concern').
+def read_dataset_ndjson(file_name):
     """
-    text_lower = text.lower()
-
-    # High-Risk: Contains direct crisis phrases
-    # This can be extended to be more phrases
-    high_risk_phrases = ["dont want to be here", "cant do this anymore","dont want to live"
-                          "no reason to live", "ending it all", "want to die","want to kill"]
-    
-    if any(phrase in text_lower for phrase in high_risk_phrases):
-        return "High-Risk"
+    Streams posts from a newline-delimited JSON file one at a time.
 
-    # Moderate Concern: Seeking help or discussing struggles
-    if any(term in text_lower for term in high_risk_terms):
-        return "Moderate Concern"
+    Args:
+        file_name (str): The name of the NDJSON file to read.
 
-    # Otherwise, it's Low Concern
-    return "Low Concern"
+    Yields:
+        dict: One post per line of the file.
+    """
+    with open(file_name, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
 
-def read_dataset(file_name):
+def analyze_sentiments_vectorized(tfidf_matrix, vocabulary):
     """
-    Reads a JSON dataset from a file and loads it into a Python dictionary.
+    Scores the sentiment of all posts at once from their TF-IDF vectors.
 
-    This function opens a JSON file, reads its contents, and parses it 
-    into a dictionary or list, depending on the file structure.
+    Each vocabulary term gets a signed weight from the VADER lexicon, and the
+    per-post score is a single sparse matrix-vector product - one BLAS-level
+    pass instead of one per-post analyzer invocation.
 
     Args:
-        file_name (str): The name of the JSON file to read.
+        tfidf_matrix (scipy.sparse.csr_matrix): TF-IDF matrix of all posts.
+        vocabulary (dict): The vectorizer's term -> column index mapping.
 
     Returns:
-        dictionary: The loaded dataset from the JSON file.
+        np.ndarray: Sentiment labels ('Positive', 'Negative', 'Neutral'), one per post.
     """
-    
-    with open(file_name, 'r') as f:
-        dataset = json.load(f)
-    return dataset
-
-def classify_posts(all_posts,high_risk_terms):
+    lexicon = SentimentIntensityAnalyzer().lexicon
+    weights = np.zeros(len(vocabulary))
+    for word, index in vocabulary.items():
+        weights[index] = lexicon.get(word, 0.0)
+    scores = tfidf_matrix @ weights
+    return np.where(scores > 0, "Positive", np.where(scores < 0, "Negative", "Neutral"))
+
+def classify_posts_vec(all_posts_lower,sentiments,high_risk_terms):
     """
-    Classifies posts based on sentiment and risk level.
+    Classifies posts based on sentiment and risk level, vectorized.
 
-    This function analyzes the sentiment of each post and categorizes 
-    its risk level based on predefined high-risk terms.
+    Risk levels are assigned with two precompiled alternation regexes run by
+    the C regex engine over a pandas Series - two passes over the corpus
+    instead of one Python substring check per phrase per post. The posts are
+    expected pre-lowercased, so the patterns can match case-sensitively.
 
     Args:
-        all_posts (list): A list of post contents (strings).
+        all_posts_lower (list): A list of lowercased post contents (strings).
+        sentiments (np.ndarray): Sentiment labels, one per post.
         high_risk_terms (set): A set of high-risk words/phrases to detect crisis situations.
 
     Returns:
         list: A list of tuples containing (sentiment, risk_level) for each post.
     """
-    analysis = []
-    for post in all_posts:
-        sentiment = analyze_sentiment(post)
-        risk_level = categorize_risk_level(post,high_risk_terms)
-        analysis.append((sentiment,risk_level))
-    return analysis
+    hr_pattern = re.compile("|".join(map(re.escape, HIGH_RISK_PHRASES)))
+    mc_pattern = re.compile("|".join(map(re.escape, high_risk_terms)))
+
+    posts = pd.Series(all_posts_lower)
+    is_high_risk = posts.str.contains(hr_pattern)
+    is_moderate = posts.str.contains(mc_pattern) & ~is_high_risk
+
+    risk_levels = np.select(
+        [is_high_risk, is_moderate],
+        ["High-Risk", "Moderate Concern"],
+        default="Low Concern"
+    )
+    return list(zip(sentiments, risk_levels))
 
 def make_table(analysis,file_name):
     """
     Generates a summary table of post classifications and saves it as a CSV file.
 
-    This function takes the list of classified posts, creates a DataFrame, 
-    counts the occurrences of each (sentiment, risk_level) combination, 
-    and saves the result to a CSV file.
+    This function tallies the (sentiment, risk_level) combinations with a
+    Counter (only 9 possible cells, so a DataFrame groupby is overkill) and
+    writes the counts to a CSV file.
 
     Args:
         analysis (list): A list of tuples (sentiment, risk_level).
         file_name (str): The name of the CSV file to save the table.
 
     Returns:
-        pd.DataFrame: The dataframe containing analysis.
+        Counter: The per-(sentiment, risk_level) counts.
     """
-    # Convert list of tuples to DataFrame
-    df = pd.DataFrame(analysis, columns=["sentiment", "risk_level"])
+    # Tally the (sentiment, risk_level) combinations in one pass
+    counts = Counter(analysis)
 
-    # Create summary table: Count of posts by Sentiment & Risk Level
-    summary_table = df.value_counts().reset_index(name="count")
+    with open(file_name, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["sentiment", "risk_level", "count"])
+        writer.writerows((sentiment, risk_level, count)
+                         for (sentiment, risk_level), count in counts.most_common())
 
-    summary_table.to_csv(file_name,index=False)
     print(f"Table saved to {file_name}")
-    return df
+    return counts
 
-def make_plot(df,file_name):
+def make_plot(counts,file_name):
     """
     Creates and saves a bar plot visualizing post distribution by sentiment and risk level.
 
-    This function generates a count plot using Seaborn, displaying the number of posts
-    categorized by sentiment and risk level, and saves the visualization to a file.
+    This function draws grouped bars straight from the summary counts,
+    displaying the number of posts categorized by sentiment and risk level,
+    and saves the visualization to a file.
 
     Args:
-        df (pd.DataFrame): The DataFrame containing analysis(sentiment and risk levels).
+        counts (Counter): Counts keyed by (sentiment, risk_level) tuples.
         file_name (str): The file name to save the plot.
 
     Returns: None
@@ -132,37 +130,44 @@ def make_plot(df,file_name):
     # Set plot style
     sns.set_style("whitegrid")
 
+    risk_levels = sorted({risk_level for _, risk_level in counts})
+    sentiments = sorted({sentiment for sentiment, _ in counts})
+
     # Plot: Distribution of Posts by Sentiment & Risk Level
     plt.figure(figsize=(10, 6))
-    ax = sns.countplot(data=df, x="risk_level", hue="sentiment", palette="pastel")
+    x = np.arange(len(risk_levels))
+    width = 0.8 / len(sentiments)
+    for i, sentiment in enumerate(sentiments):
+        heights = [counts.get((sentiment, risk_level), 0) for risk_level in risk_levels]
+        plt.bar(x + i * width, heights, width, label=sentiment)
 
     # Add labels
     plt.title("Distribution of Posts by Sentiment & Risk Level")
     plt.xlabel("Risk Level")
     plt.ylabel("Number of Posts")
+    plt.xticks(x + width * (len(sentiments) - 1) / 2, risk_levels)
     plt.legend(title="Sentiment")
 
     # Save the plot
     plt.savefig(file_name)
     print(f"Plot saved to {file_name}")
 
-def update_dataset(dataset,df):
+def update_dataset(dataset,analysis):
     """
-    Updates the dataset by adding 'sentiment' and 'risk_level' from the DataFrame.
+    Updates the dataset by adding 'sentiment' and 'risk_level' from the analysis.
 
     Args:
         dataset (list): List of Reddit posts stored as dictionaries.
-        df (pd.DataFrame): DataFrame containing 'sentiment' and 'risk_level'.
+        analysis (list): List of (sentiment, risk_level) tuples, one per post.
 
     Returns:
         list: Updated dataset with sentiment and risk levels added.
     """
-    # Iterate through the dataset and update each post with sentiment & risk level
-    for i, post in enumerate(dataset):
-        if i < len(df):
-            post["sentiment"] = df.iloc[i]["sentiment"]
-            post["risk_level"] = df.iloc[i]["risk_level"]
-    
+    # zip over the plain tuples; no pandas row dispatch per post
+    for post, (sentiment, risk_level) in zip(dataset, analysis):
+        post["sentiment"] = sentiment
+        post["risk_level"] = risk_level
+
     return dataset
 
 def save_posts_to_json(posts, filename="filtered_reddit_posts.json", pretty=True):
@@ -177,11 +182,11 @@ def save_posts_to_json(posts, filename="filtered_reddit_posts.json", pretty=True
     Returns:
         None
     """
-    with open(filename, 'w') as json_file:
-        json.dump(posts, json_file, indent=4 if pretty else None)
+    with open(filename, 'wb') as json_file:
+        json_file.write(orjson.dumps(posts, option=orjson.OPT_INDENT_2 if pretty else 0))
 def main():
-    # Read the dataset stored in Task 1 folder
-    dataset = read_dataset(file_name='../Task-1/cleaned_dataset.json')
+    # Read the dataset stored in Task 1 folder (written as NDJSON)
+    dataset = list(read_dataset_ndjson(file_name='../Task-1/cleaned_dataset.ndjson'))
 
     # Extract only the post contents from the dataset
     all_posts = [post["content"] for post in dataset]
@@ -192,23 +197,34 @@ def main():
     # Fit it according to our text
     tfidf_matrix = vectorizer.fit_transform(all_posts)
 
-    # Extract the terms
-    feature_names = vectorizer.get_feature_names_out()
+    # The fitted vocabulary dict already maps term -> column index; no need to
+    # materialize the full sorted feature-name array
+    vocabulary = vectorizer.vocabulary_
+
+    # Extract the high risk terms: the 30 most informative (highest-IDF) terms.
+    # argpartition finds the top 30 indices without fully sorting the IDF array
+    idf = vectorizer.idf_
+    top_indices = set(np.argpartition(idf, -30)[-30:].tolist())
+    high_risk_terms = frozenset(word for word, index in vocabulary.items() if index in top_indices)
+
+    # Score sentiment for all posts in one sparse matrix-vector product
+    sentiments = analyze_sentiments_vectorized(tfidf_matrix=tfidf_matrix,vocabulary=vocabulary)
 
-    # Extract the high risk terms
-    high_risk_terms = set(feature_names[:30]) # top 30 high risk terms
+    # Lowercase every post once up front; the phrases and vocabulary terms are
+    # already lowercase, so the risk patterns can skip case-insensitive matching
+    all_posts_lower = [post.lower() for post in all_posts]
 
     # Classify the posts by sentiment and risk level
-    analysis = classify_posts(all_posts=all_posts,high_risk_terms=high_risk_terms)
+    analysis = classify_posts_vec(all_posts_lower=all_posts_lower,sentiments=sentiments,high_risk_terms=high_risk_terms)
 
     # Make a summary table of the analysis
-    df = make_table(analysis=analysis,file_name='summary_table.csv')
+    counts = make_table(analysis=analysis,file_name='summary_table.csv')
 
     # Make a plot of the analysis
-    make_plot(df=df,file_name="distribution_of_posts.jpeg")
+    make_plot(counts=counts,file_name="distribution_of_posts.jpeg")
 
     # Update dataset with sentiment and risk levels.
-    final_dataset = update_dataset(dataset=dataset,df=df)
+    final_dataset = update_dataset(dataset=dataset,analysis=analysis)
 
     # Save updated dataset
     filename="updated_dataset.json"
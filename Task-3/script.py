@@ -1,16 +1,52 @@
 # importing libraries
 import spacy
-import json
+import orjson
 import folium
 from folium.plugins import HeatMap
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from geopy.geocoders import Nominatim
-import time
-from geopy.exc import GeocoderTimedOut
+from geopy.extra.rate_limiter import RateLimiter
+import geonamescache
+import hashlib
+import os
+import pickle
+import shelve
 from datetime import datetime
 import pandas as pd
 import sys
 
+# Persisted location cache so later runs skip even the Nominatim fallback
+LOCATION_CACHE_FILE = "location_cache.pkl"
+
+# Persisted NER results keyed by content hash; repeat runs skip spaCy entirely
+NER_CACHE_FILE = "ner_cache.db"
+
+# Load the English NLP model once at import; only NER is needed, so the
+# tagger/parser/lemmatizer components are disabled to skip unused work
+NLP = spacy.load("en_core_web_sm", disable=["tagger", "parser", "attribute_ruler", "lemmatizer"])
+
+# Custom mapping of common abbreviations to full names
+ABBREVIATION_MAPPING = {
+    "NYC": "New York City",
+    "LA": "Los Angeles",
+    "SF": "San Francisco",
+    "UK": "United Kingdom",
+    "USA": "United States",
+    "US":"United States",
+    "UAE": "United Arab Emirates",
+    "TX": "Texas",
+    "CA": "California",
+    "DC": "Washington, D.C.",
+}
+
+# Lowercased lookup table built once at import for case-insensitive matching
+ABBREV_MAP = {key.lower(): val for key, val in ABBREVIATION_MAPPING.items()}
+
+# Words the NER pass mislabels as locations; filtered out of the counts
+UNWANTED_WORDS = frozenset({"no location found", "meth", "kinda", "example", "country",
+                            "place", "world", "earth", "everywhere", "phobia", "mcas"})
+
 def read_dataset(file_name):
     """
     Reads a JSON dataset from a file and loads it into a Python dictionary.
@@ -24,11 +60,29 @@ def read_dataset(file_name):
     Returns:
         dictionary: The loaded dataset from the JSON file.
     """
-    
-    with open(file_name, 'r') as f:
-        dataset = json.load(f)
+
+    with open(file_name, 'rb') as f:
+        dataset = orjson.loads(f.read())
     return dataset
 
+def read_dataset_ndjson(file_name):
+    """
+    Streams posts from a newline-delimited JSON file one at a time.
+
+    Unlike read_dataset, this generator never materializes the whole dataset,
+    so consumers like nlp.pipe can process posts as they are parsed.
+
+    Args:
+        file_name (str): The name of the NDJSON file to read.
+
+    Yields:
+        dict: One post per line of the file.
+    """
+    with open(file_name, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
 def save_posts_to_json(posts, filename="filtered_reddit_posts.json", pretty=True):
     """Saves filtered Reddit posts to a JSON file.
 
@@ -41,70 +95,98 @@ def save_posts_to_json(posts, filename="filtered_reddit_posts.json", pretty=True
     Returns:
         None
     """
-    with open(filename, 'w') as json_file:
-        json.dump(posts, json_file, indent=4 if pretty else None)
-
-def extract_locations(text,nlp,abbreviation_mapping):
-    doc = nlp(text)
-
-    # Normalize abbreviation mapping keys to lowercase for case-insensitive lookup
-    lower_abbreviation_mapping = {key.lower(): val for key, val in abbreviation_mapping.items()}
+    with open(filename, 'wb') as json_file:
+        json_file.write(orjson.dumps(posts, option=orjson.OPT_INDENT_2 if pretty else 0))
 
-    # Extract named entities (GPE) and normalize to lowercase for comparison
+def extract_locations(text,doc):
+    # Extract named entities (GPE) from the already-processed doc
     locations = {ent.text for ent in doc.ents if ent.label_ == "GPE"}
 
-    # Check for abbreviations (case-insensitive) and map them
-    words = text.split()
-    for word in words:
-        lower_word = word.lower()
-        if lower_word in lower_abbreviation_mapping:
-            locations.add(lower_abbreviation_mapping[lower_word])
+    # Check for abbreviations (case-insensitive) and map them; lowercase the
+    # whole text once instead of calling .lower() on every word
+    for lower_word in text.lower().split():
+        if lower_word in ABBREV_MAP:
+            locations.add(ABBREV_MAP[lower_word])
 
     return list(locations) if locations else ["no location found"]
 
 def process_posts(posts):
-    nlp = spacy.load("en_core_web_sm")  # Load English NLP model
-    # Custom mapping of common abbreviations to full names
-    abbreviation_mapping = {
-        "NYC": "New York City",
-        "LA": "Los Angeles",
-        "SF": "San Francisco",
-        "UK": "United Kingdom",
-        "USA": "United States",
-        "US":"United States",
-        "UAE": "United Arab Emirates",
-        "TX": "Texas",
-        "CA": "California",
-        "DC": "Washington, D.C.",
-    }
     all_locations = []
-    for post in posts:
-        text = post["content"]
-        locations = extract_locations(text=text,nlp=nlp,abbreviation_mapping=abbreviation_mapping)
-        all_locations.append(locations)
-        post["location"] = locations
+    with shelve.open(NER_CACHE_FILE) as ner_cache:
+        # Key each post by a hash of its content; the cleaned text rarely
+        # changes between pipeline runs, so cached posts skip spaCy entirely
+        keys = [hashlib.blake2b(post["content"].encode(), digest_size=16).hexdigest()
+                for post in posts]
+        uncached = [(key, post["content"]) for key, post in zip(keys, posts)
+                    if key not in ner_cache]
+
+        # nlp.pipe batches the docs through spaCy's C-level pipeline instead of
+        # paying the per-call Python overhead of nlp(text) for every post
+        texts = [text for _, text in uncached]
+        for (key, text), doc in zip(uncached, NLP.pipe(texts, batch_size=64, n_process=2)):
+            ner_cache[key] = extract_locations(text=text,doc=doc)
+
+        for post, key in zip(posts, keys):
+            locations = ner_cache[key]
+            all_locations.append(locations)
+            post["location"] = locations
     return posts,all_locations
 
-def get_coordinates(geolocator,location,location_cache):
-    """Retrieve coordinates for a given location, with caching and retries."""
-    if location in location_cache:
-        return location_cache[location]
-    
-    for _ in range(3):  # Retry up to 3 times
+def build_offline_geocoder_index():
+    """Builds an offline location -> (lat, lon) index from the GeoNames data.
+
+    geonamescache ships the GeoNames cities locally, so most lookups become an
+    O(1) dict hit instead of an HTTP round-trip to Nominatim. Where several
+    cities share a name, the most populous one wins.
+
+    Returns:
+        dict: A mapping of lowercased location names to (latitude, longitude).
+    """
+    gc = geonamescache.GeonamesCache()
+    index = {}
+    best_population = {}
+    for city in gc.get_cities().values():
+        name = city["name"].lower()
+        if city["population"] >= best_population.get(name, 0):
+            best_population[name] = city["population"]
+            index[name] = (city["latitude"], city["longitude"])
+    return index
+
+def load_location_cache():
+    """Loads the persisted location cache from disk, or returns an empty one."""
+    if os.path.exists(LOCATION_CACHE_FILE):
+        with open(LOCATION_CACHE_FILE, 'rb') as f:
+            return pickle.load(f)
+    return {}
+
+def save_location_cache(location_cache):
+    """Persists the location cache to disk for subsequent runs."""
+    with open(LOCATION_CACHE_FILE, 'wb') as f:
+        pickle.dump(location_cache, f)
+
+def get_coordinates(geocode,location,location_cache,offline_index):
+    """Retrieve coordinates for a given location.
+
+    The lookup order is: persisted cache, offline GeoNames index, and only
+    then the rate-limited Nominatim callable for names the local data misses.
+    """
+    location_lower = location.lower()
+    if location_lower in location_cache:
+        return location_cache[location_lower]
+
+    coords = offline_index.get(location_lower)
+    if coords is None:
         try:
-            geo = geolocator.geocode(location)
+            geo = geocode(location)
             if geo:
                 coords = (geo.latitude, geo.longitude)
-                location_cache[location] = coords  # Store in cache
-                return coords
-        except GeocoderTimedOut:
-            print(f"Timeout for {location}, retrying...")
-            time.sleep(2)  # Wait before retrying
         except Exception as e:
             print(f"Error geocoding {location}: {e}")
             return None
 
-    return None  # Return None if all retries fail
+    if coords:
+        location_cache[location_lower] = coords  # Store in cache
+    return coords
 
 def make_map(location_coordinates):
     # Create a Folium Map
@@ -161,17 +243,35 @@ def make_map(location_coordinates):
     print(f"Map saved to {map_path}")
 
 def get_location_coordinates(user_agent,location_counts):
-    # Initialize geocoder
+    # Initialize geocoder (only used for names the offline index misses);
+    # RateLimiter enforces Nominatim's 1 req/s policy and handles the retries
+    # and backoff that used to be a hand-rolled sleep loop
     geolocator = Nominatim(user_agent=user_agent, timeout=10)
-    # Caching to avoid redundant API calls
-    location_cache = {}
+    geocode = RateLimiter(geolocator.geocode, min_delay_seconds=1, max_retries=3, error_wait_seconds=2)
+    # Offline GeoNames index for O(1) lookups without any API calls
+    offline_index = build_offline_geocoder_index()
+    # Persisted cache so repeat runs skip the Nominatim fallback too
+    location_cache = load_location_cache()
+
+    # Resolve the unique location names in a small thread pool; cache and
+    # offline hits return immediately while the rate limiter spaces out the
+    # actual Nominatim requests
+    coordinates_by_name = {}
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            executor.submit(get_coordinates, geocode, location, location_cache, offline_index): location
+            for location in location_counts
+        }
+        for future in as_completed(futures):
+            coordinates_by_name[futures[future]] = future.result()
+    save_location_cache(location_cache)
+
     # Convert location names to coordinates
     location_coordinates = []
     for location, count in location_counts.items():
-        coords = get_coordinates(geolocator=geolocator,location=location,location_cache=location_cache)
+        coords = coordinates_by_name.get(location)
         if coords:
             location_coordinates.append((*coords, count))
-        time.sleep(2)  # Increase sleep time to prevent rate limiting
     return location_coordinates
 def read_and_process_data(file_name):
     """
@@ -208,14 +308,11 @@ def filter_locations(all_locations):
     Returns:
         Counter: A Counter object with the count of each filtered location.
     """
-    flat_locations = [loc for sublist in all_locations for loc in sublist]
-    
-    unwanted_words = {"no location found", "meth", "kinda", "example", "country",
-                      "place", "world", "earth", "everywhere", "phobia", "mcas"}
-    
-    filtered_locations = [loc for loc in flat_locations if loc.lower() not in unwanted_words]
-    
-    return Counter(filtered_locations)
+    # Flatten, filter and count in a single pass, with no intermediate lists
+    location_counts = Counter()
+    for sublist in all_locations:
+        location_counts.update(loc for loc in sublist if loc.lower() not in UNWANTED_WORDS)
+    return location_counts
 
 def save_top_locations(location_counts, file_path="top_5_locations.csv"):
     """